@@ -0,0 +1,9 @@
+"""Makes the repo-root mdtick module importable from the archived scripts."""
+import sys
+from pathlib import Path
+
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+
+# Appended rather than prepended, so an installed mdtick still takes priority
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
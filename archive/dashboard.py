@@ -1,35 +1,18 @@
 #!/usr/bin/env python3
 import argparse
-import re
 from pathlib import Path
 
+import _repo_path  # noqa: F401
+from mdtick import parse_checklist
 
-def parse_checklist(file_path: Path) -> tuple[int, int, str | None]:
-    """Parses a markdown checklist file and returns done, total, and optional title."""
-    with file_path.open("r", encoding="utf-8") as f:
-        content = f.read()
 
-    all_tasks = re.findall(r"- \[( |x)\] ", content)
-    total = len(all_tasks)
-    done = sum(1 for t in all_tasks if t == "x")
-
-    # Try to extract the first level-1 heading as the title
-    title_match = re.search(r"^# (.+)", content, re.MULTILINE)
-    title = title_match.group(1).strip() if title_match else None
-
-    return done, total, title
-
-
-def show_progress(
-    done: int, total: int, title: str | None = None, bar_length: int = 40
-) -> None:
-    """Displays a progress bar in the terminal, optionally with a custom title."""
+def show_progress(done: int, total: int, title: str, bar_length: int = 40) -> None:
+    """Displays a progress bar in the terminal under the given title."""
     percent = (done / total) * 100 if total else 0
     filled_length = int(bar_length * done // total) if total else 0
     bar = "█" * filled_length + "-" * (bar_length - filled_length)
 
-    heading = f"📊 {title}" if title else "📊 Checklist Progress"
-    print(f"{heading}")
+    print(f"📊 {title}")
     print(f"[{bar}] {done}/{total} tasks completed ({percent:.1f}%)\n")
 
 
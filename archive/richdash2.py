@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 import argparse
-import re
 import time
 from pathlib import Path
 from rich.console import Console
@@ -12,22 +11,10 @@ from rich.progress import (
     TimeRemainingColumn,
 )
 
-console = Console()
-
-
-def parse_checklist(file_path: Path) -> tuple[int, int, str | None]:
-    """Parses a markdown checklist file and returns done, total, and optional title."""
-    with file_path.open("r", encoding="utf-8") as f:
-        content = f.read()
+import _repo_path  # noqa: F401
+from mdtick import parse_checklist
 
-    all_tasks = re.findall(r"- \[( |x)\] ", content)
-    total = len(all_tasks)
-    done = sum(1 for t in all_tasks if t == "x")
-
-    title_match = re.search(r"^# (.+)", content, re.MULTILINE)
-    title = title_match.group(1).strip() if title_match else file_path.stem
-
-    return done, total, title
+console = Console()
 
 
 def create_dashboard(config_file: Path) -> None:
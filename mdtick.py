@@ -1,20 +1,50 @@
 #!/usr/bin/env python3
+from __future__ import annotations
+
 import argparse
-import re
-import time
+import os
+from concurrent.futures import ThreadPoolExecutor
+from html import escape
 from pathlib import Path
-from rich.console import Console
-from rich.table import Table
-from rich.progress import (
-    Progress,
-    BarColumn,
-    TextColumn,
-    TaskProgressColumn,
-    TimeRemainingColumn,
-)
+from typing import TYPE_CHECKING
+
+# rich is imported where it is used, so --help/--version don't pay for it
+if TYPE_CHECKING:
+    from rich.console import Console
 
 __version__ = "0.2.0"
 
+_PARSE_CACHE: dict[Path, tuple[tuple[int, int], tuple[int, int, str]]] = {}
+
+# Progress bars have 20 cells, so there are only 21 possible strings
+_BARS = tuple("█" * i + "-" * (20 - i) for i in range(21))
+
+_HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="UTF-8">
+<title>mdtick dashboard</title>
+<style>
+body { font-family: Menlo, "DejaVu Sans Mono", monospace; }
+table { border-collapse: collapse; }
+caption { font-style: italic; }
+th, td { border: 1px solid #888; padding: 0 0.5em; }
+td:first-child { color: teal; font-weight: bold; }
+td.missing { color: red; }
+.num { text-align: right; }
+</style>
+</head>
+<body>
+<table>
+<caption>Dashboard</caption>
+<tr><th>Project</th><th class="num">Done</th><th class="num">Total</th>
+<th>Progress</th><th class="num">Percent</th></tr>
+"""
+_HTML_TAIL = """</table>
+</body>
+</html>
+"""
+
 ASCII_LOGO = r"""
  __  __ _____  _______ _ _      
 |  \/  |  __ \|__   __(_) |     
@@ -32,21 +62,74 @@ def print_banner(console: Console):
     console.print(f"[bold green]{ASCII_LOGO.format(version=__version__)}[/bold green]")
 
 
-def parse_checklist(file_path: Path) -> tuple[int, int, str]:
-    with file_path.open("r", encoding="utf-8") as f:
-        content = f.read()
+def _extract_title(data: bytes) -> str | None:
+    """Returns the first level-1 heading, decoding only that line."""
+    if data.startswith(b"# "):
+        start = 2
+    else:
+        start = data.find(b"\n# ")
+        if start == -1:
+            return None
+        start += 3
+    end = data.find(b"\n", start)
+    line = data[start : end if end != -1 else None]
+    return line.decode("utf-8", errors="replace").strip()
+
+
+def _read_checklist(file_path: Path) -> tuple[int, int, str]:
+    data = file_path.read_bytes()
+
+    # The markers are ASCII, so they can be counted without decoding the file
+    done = data.count(b"- [x] ") + data.count(b"- [X] ")
+    total = done + data.count(b"- [ ] ")
+
+    return done, total, _extract_title(data) or file_path.stem
+
+
+def parse_checklist(
+    file_path: Path, st: os.stat_result | None = None
+) -> tuple[int, int, str]:
+    # Files are only re-read when their mtime or size has changed.
+    if st is None:
+        st = file_path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _PARSE_CACHE.get(file_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    result = _read_checklist(file_path)
+    _PARSE_CACHE[file_path] = (key, result)
+    return result
+
 
-    all_tasks = re.findall(r"- \[( |x)\] ", content)
-    total = len(all_tasks)
-    done = sum(1 for t in all_tasks if t == "x")
+def _safe_parse(md_path: Path) -> tuple[int, int, str] | None:
+    try:
+        st = md_path.stat()
+    except OSError:
+        return None
+    return parse_checklist(md_path, st)
 
-    title_match = re.search(r"^# (.+)", content, re.MULTILINE)
-    title = title_match.group(1).strip() if title_match else file_path.stem
 
-    return done, total, title
+def parse_checklists(
+    markdown_paths: list[Path],
+) -> list[tuple[Path, tuple[int, int, str] | None]]:
+    # Parsing is I/O bound, so a thread pool overlaps the file reads;
+    # map() keeps the results in config order.
+    with ThreadPoolExecutor(max_workers=min(32, len(markdown_paths) or 1)) as pool:
+        return list(zip(markdown_paths, pool.map(_safe_parse, markdown_paths)))
 
 
 def create_animated_dashboard(console: Console, markdown_paths: list[Path]) -> None:
+    import time
+
+    from rich.progress import (
+        Progress,
+        BarColumn,
+        TextColumn,
+        TaskProgressColumn,
+        TimeRemainingColumn,
+    )
+
     with Progress(
         TextColumn("[bold blue]{task.fields[project]}"),
         BarColumn(bar_width=30),
@@ -56,23 +139,27 @@ def create_animated_dashboard(console: Console, markdown_paths: list[Path]) -> N
         transient=False,
     ) as progress:
         tasks = []
-        for md_path in markdown_paths:
-            if not md_path.exists():
+        for md_path, result in parse_checklists(markdown_paths):
+            if result is None:
                 console.print(f"[yellow]⚠️ File not found:[/yellow] {md_path}")
                 continue
 
-            done, total, title = parse_checklist(md_path)
+            done, total, title = result
             task_id = progress.add_task("", total=total, completed=0, project=title)
             tasks.append((task_id, done))
 
-        # Advance the bars
-        for task_id, done in tasks:
-            for _ in range(done):
-                progress.advance(task_id)
-                time.sleep(0.05)
+        # Fill all bars together in at most 40 frames, so the animation
+        # takes at most ~2s regardless of how many tasks are done
+        frames = min(40, max((done for _, done in tasks), default=0))
+        for frame in range(1, frames + 1):
+            for task_id, done in tasks:
+                progress.update(task_id, completed=done * frame // frames)
+            time.sleep(0.05)
 
 
 def create_table_dashboard(console: Console, markdown_paths: list[Path]) -> None:
+    from rich.table import Table
+
     table = Table(title="Dashboard")
 
     table.add_column("Project", style="bold cyan")
@@ -81,34 +168,63 @@ def create_table_dashboard(console: Console, markdown_paths: list[Path]) -> None
     table.add_column("Progress", justify="left")
     table.add_column("Percent", justify="right")
 
-    for md_path in markdown_paths:
-        if not md_path.exists():
+    for md_path, result in parse_checklists(markdown_paths):
+        if result is None:
             table.add_row(f"[red]⚠️ {md_path.name}[/red]", "-", "-", "-", "-")
             continue
 
-        done, total, title = parse_checklist(md_path)
+        done, total, title = result
         percent = (done / total) * 100 if total else 0
-        bar = "█" * int(percent // 5) + "-" * (20 - int(percent // 5))
-        table.add_row(title, str(done), str(total), f"{bar}", f"{percent:.1f}%")
+        bar = _BARS[int(percent // 5)]
+        table.add_row(title, str(done), str(total), bar, f"{percent:.1f}%")
 
     console.print(table)
 
 
+def export_html_dashboard(markdown_paths: list[Path], html_path: Path) -> None:
+    # Rows are collected as strings and joined once; files already parsed
+    # for the terminal view come straight from the parse cache.
+    parts = [_HTML_HEAD]
+    for md_path, result in parse_checklists(markdown_paths):
+        if result is None:
+            parts.append(
+                f'<tr><td class="missing">⚠️ {escape(md_path.name)}</td>'
+                '<td class="num">-</td><td class="num">-</td>'
+                '<td>-</td><td class="num">-</td></tr>\n'
+            )
+            continue
+
+        done, total, title = result
+        percent = (done / total) * 100 if total else 0
+        bar = _BARS[int(percent // 5)]
+        parts.append(
+            f"<tr><td>{escape(title)}</td>"
+            f'<td class="num">{done}</td><td class="num">{total}</td>'
+            f'<td>{bar}</td><td class="num">{percent:.1f}%</td></tr>\n'
+        )
+    parts.append(_HTML_TAIL)
+
+    html_path.write_text("".join(parts), encoding="utf-8")
+
+
 def create_dashboard(
     console: Console, config_file: Path, view: str, banner: bool
-) -> None:
+) -> list[Path]:
     if not config_file.exists():
         console.print(f"[bold red]❌ Config file not found:[/bold red] {config_file}")
-        return
+        return []
 
     with config_file.open("r", encoding="utf-8") as f:
-        markdown_paths = [Path(line.strip()) for line in f if line.strip()]
+        # dict.fromkeys drops repeated entries while keeping config order
+        markdown_paths = list(
+            dict.fromkeys(Path(line.strip()) for line in f if line.strip())
+        )
 
     if not markdown_paths:
         console.print(
             "[bold red]❌ No markdown files found in the config file.[/bold red]"
         )
-        return
+        return []
 
     if banner:
         print_banner(console)
@@ -117,6 +233,8 @@ def create_dashboard(
     else:
         create_animated_dashboard(console, markdown_paths)
 
+    return markdown_paths
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(
@@ -154,25 +272,17 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    # If exporting HTML, override the animated view to table
-    if args.export_html and args.view == "animated":
-        print(
-            "Warning: The animated view causes a very large HTML with each step. "
-            "Switching to table view for HTML export."
-        )
-        args.view = "table"
+    from rich.console import Console
 
-    # Create a console that records only if we're exporting
-    console = Console(record=bool(args.export_html))
+    console = Console()
 
     config_path = Path(args.config_file)
-    create_dashboard(console, config_path, args.view, args.banner)
+    markdown_paths = create_dashboard(console, config_path, args.view, args.banner)
 
-    # If requested, export to HTML
-    if args.export_html:
-        html_content = console.export_html(inline_styles=True)
-        with open(args.export_html, "w", encoding="utf-8") as f:
-            f.write(html_content)
+    # The HTML is written directly rather than recorded from the console,
+    # so any view can be exported without buffering its output
+    if args.export_html and markdown_paths:
+        export_html_dashboard(markdown_paths, Path(args.export_html))
         console.print(f"\n[green]HTML exported to:[/green] {args.export_html}")
 
 
@@ -2,18 +2,45 @@
 
 import os
 import argparse
+import mmap
 import re
+from concurrent.futures import ThreadPoolExecutor
 from tqdm import tqdm
 
 
-def file_contains_tasklist(file_path):
-    pattern = re.compile(r"^(\s*[\-\*\+]\s*\[[xX ]\])")
+# Matched against raw bytes, so no decoding is needed. Bytes \s is ASCII-only,
+# so the UTF-8 encodings of the other characters str \s accepts are spelled
+# out, and \r counts as a line start so CR-only files still split into lines.
+# Each whitespace byte has exactly one way to match, which keeps indented
+# lines from backtracking exponentially.
+_INLINE_SPACE = (
+    rb"(?:[ \t\f\v\x1c-\x1f]|\xc2[\x85\xa0]|\xe1\x9a\x80"
+    rb"|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]|\xe2\x81\x9f|\xe3\x80\x80)"
+)
+_TASKLIST_RE = re.compile(
+    rb"(?:^|\r)" + _INLINE_SPACE + rb"*[\-\*\+]" + _INLINE_SPACE + rb"*\[[xX ]\]",
+    re.MULTILINE,
+)
+_TASK_MARKERS = (b"[ ]", b"[x]", b"[X]")
+_MD_SUFFIXES = (".md", ".MD", ".Md", ".mD")
+_MMAP_THRESHOLD = 1024 * 1024
+
+
+def _has_tasklist(data):
+    # A substring check is much cheaper than the regex and rules out most files
+    if all(data.find(marker) == -1 for marker in _TASK_MARKERS):
+        return False
+    return _TASKLIST_RE.search(data) is not None
 
+
+def file_contains_tasklist(file_path):
     try:
-        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                if pattern.search(line):
-                    return True
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+                # Search large files in place instead of copying them into memory
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return _has_tasklist(data)
+            return _has_tasklist(f.read())
     except Exception as e:
         tqdm.write(f"Error reading file: {file_path} ({e})")
     return False
@@ -21,10 +48,18 @@ def file_contains_tasklist(file_path):
 
 def find_markdown_files(folder):
     md_files = []
-    for root, dirs, files in os.walk(folder):
-        for filename in files:
-            if filename.lower().endswith(".md"):
-                md_files.append(os.path.join(root, filename))
+    stack = [folder]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(_MD_SUFFIXES) and entry.is_file():
+                        md_files.append(entry.path)
+        except OSError:
+            # Match os.walk, which silently skips unreadable directories
+            continue
     return md_files
 
 
@@ -41,13 +76,22 @@ def main():
 
     matching_files = []
 
-    for file_path in tqdm(md_files, desc="Scanning files", unit="file"):
-        if file_contains_tasklist(file_path):
-            matching_files.append(file_path)
+    # The work is mostly waiting on disk, so oversubscribe the CPUs with threads
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(file_contains_tasklist, md_files)
+        for file_path, has_tasks in tqdm(
+            zip(md_files, results),
+            total=len(md_files),
+            desc="Scanning files",
+            unit="file",
+        ):
+            if has_tasks:
+                matching_files.append(file_path)
 
     with open(args.output_file, "w", encoding="utf-8") as out_f:
-        for path in matching_files:
-            out_f.write(path + "\n")
+        if matching_files:
+            out_f.write("\n".join(matching_files) + "\n")
 
     print(
         f"\n✅ Done! Found {len(matching_files)} Markdown files containing task lists."
@@ -0,0 +1,30 @@
+import time
+
+import pytest
+
+from scan import _has_tasklist
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"- [ ] plain\n",
+        b"text\r- [ ] cr only\r",
+        " - [x] nbsp\n".encode(),
+        b"\n\n\t+ [X] indented\r\n",
+    ],
+)
+def test_detects_task_items(data):
+    assert _has_tasklist(data)
+
+
+@pytest.mark.parametrize("data", [b"text - [ ] mid-line\n", b"-\n[x] split\n"])
+def test_ignores_non_items(data):
+    assert not _has_tasklist(data)
+
+
+def test_long_indented_lines_do_not_backtrack():
+    data = b"- see [ ] below\n```\n" + (b" " * 5000 + b"code\n") * 3 + b"```\n"
+    start = time.perf_counter()
+    assert not _has_tasklist(data)
+    assert time.perf_counter() - start < 0.5